@@ -18,6 +18,7 @@
 #include "draco/compression/config/compression_shared.h"
 #include "draco/compression/encode.h"
 #include "draco/compression/expert_encode.h"
+#include "draco/core/bounding_box.h"
 #include "draco/core/cycle_timer.h"
 #include "draco/io/file_utils.h"
 #include "draco/io/mesh_io.h"
@@ -30,6 +31,9 @@ struct Options {
 
   bool is_point_cloud;
   int pos_quantization_bits;
+  bool use_pos_quantization_origin;
+  float pos_quantization_origin[3];
+  float pos_quantization_range;
   int tex_coords_quantization_bits;
   bool tex_coords_deleted;
   int normals_quantization_bits;
@@ -46,6 +50,9 @@ struct Options {
 Options::Options()
     : is_point_cloud(false),
       pos_quantization_bits(11),
+      use_pos_quantization_origin(false),
+      pos_quantization_origin{0.f, 0.f, 0.f},
+      pos_quantization_range(0.f),
       tex_coords_quantization_bits(10),
       tex_coords_deleted(false),
       normals_quantization_bits(8),
@@ -69,6 +76,15 @@ void Usage() {
   printf(
       "  -qp <value>           quantization bits for the position "
       "attribute, default=11.\n");
+  printf(
+      "  -qp_origin <x> <y> <z>\n"
+      "                        origin of an explicit quantization box for the "
+      "position\n"
+      "                        attribute, requires -qp_range.\n");
+  printf(
+      "  -qp_range <value>     size of the explicit quantization box for the "
+      "position\n"
+      "                        attribute, requires -qp_origin.\n");
   printf(
       "  -qt <value>           quantization bits for the texture coordinate "
       "attribute, default=10.\n");
@@ -101,6 +117,11 @@ int StringToInt(const std::string &s) {
   return strtol(s.c_str(), &end, 10);  // NOLINT
 }
 
+float StringToFloat(const std::string &s) {
+  char *end;
+  return strtof(s.c_str(), &end);
+}
+
 void PrintOptions(const draco::PointCloud &pc, const Options &options) {
   printf("Encoder options:\n");
   printf("  Compression level = %d\n", options.compression_level);
@@ -109,6 +130,13 @@ void PrintOptions(const draco::PointCloud &pc, const Options &options) {
   } else {
     printf("  Positions: Quantization = %d bits\n",
            options.pos_quantization_bits);
+    if (options.use_pos_quantization_origin) {
+      printf("  Positions: Quantization origin = (%f, %f, %f), range = %f\n",
+             options.pos_quantization_origin[0],
+             options.pos_quantization_origin[1],
+             options.pos_quantization_origin[2],
+             options.pos_quantization_range);
+    }
   }
 
   if (pc.GetNamedAttributeId(draco::GeometryAttribute::TEX_COORD) >= 0) {
@@ -218,6 +246,13 @@ int main(int argc, char **argv) {
             "attribute is 30.\n");
         return -1;
       }
+    } else if (!strcmp("-qp_origin", argv[i]) && i + 3 < argc) {
+      for (int c = 0; c < 3; ++c) {
+        options.pos_quantization_origin[c] = StringToFloat(argv[++i]);
+      }
+      options.use_pos_quantization_origin = true;
+    } else if (!strcmp("-qp_range", argv[i]) && i < argc_check) {
+      options.pos_quantization_range = StringToFloat(argv[++i]);
     } else if (!strcmp("-qt", argv[i]) && i < argc_check) {
       options.tex_coords_quantization_bits = StringToInt(argv[++i]);
       if (options.tex_coords_quantization_bits > 30) {
@@ -266,6 +301,12 @@ int main(int argc, char **argv) {
     Usage();
     return -1;
   }
+  if (options.use_pos_quantization_origin !=
+      (options.pos_quantization_range > 0.f)) {
+    printf(
+        "Error: -qp_origin and a positive -qp_range must be used together.\n");
+    return -1;
+  }
 
   std::unique_ptr<draco::PointCloud> pc;
   draco::Mesh *mesh = nullptr;
@@ -296,6 +337,35 @@ int main(int argc, char **argv) {
     return -1;
   }
 
+  if (options.use_pos_quantization_origin) {
+    if (options.pos_quantization_bits == 0) {
+      printf(
+          "Error: Explicit position quantization box requires position "
+          "quantization.\n");
+      return -1;
+    }
+    const draco::PointAttribute *const pos_att =
+        pc->GetNamedAttribute(draco::GeometryAttribute::POSITION);
+    if (pos_att == nullptr || pos_att->num_components() != 3) {
+      printf(
+          "Error: Explicit position quantization box requires a 3D position "
+          "attribute.\n");
+      return -1;
+    }
+    // Values outside of the box would silently wrap around when quantized.
+    const draco::BoundingBox bbox = pc->ComputeBoundingBox();
+    for (int c = 0; c < 3; ++c) {
+      const float box_min = options.pos_quantization_origin[c];
+      const float box_max = box_min + options.pos_quantization_range;
+      if (bbox.GetMinPoint()[c] < box_min || bbox.GetMaxPoint()[c] > box_max) {
+        printf(
+            "Error: Input positions are outside of the explicit quantization "
+            "box.\n");
+        return -1;
+      }
+    }
+  }
+
   // Delete attributes if needed. This needs to happen before we set any
   // quantization settings.
   if (options.tex_coords_quantization_bits < 0) {
@@ -340,7 +410,14 @@ int main(int argc, char **argv) {
   draco::Encoder encoder;
 
   // Setup encoder options.
-  if (options.pos_quantization_bits > 0) {
+  if (options.use_pos_quantization_origin) {
+    // Quantize positions in a user-provided box instead of the bounding box of
+    // the input. Using the same box for multiple inputs (e.g. tiles of a
+    // larger model) results in matching quantization grids.
+    encoder.SetAttributeExplicitQuantization(
+        draco::GeometryAttribute::POSITION, options.pos_quantization_bits, 3,
+        options.pos_quantization_origin, options.pos_quantization_range);
+  } else if (options.pos_quantization_bits > 0) {
     encoder.SetAttributeQuantization(draco::GeometryAttribute::POSITION,
                                      options.pos_quantization_bits);
   }